@@ -6,6 +6,7 @@ Organized with separate routes, controllers, models, and configuration.
 """
 
 import os
+import sys
 from flask import Flask, jsonify
 
 # Import configuration
@@ -14,6 +15,9 @@ from config import config
 # Import routes
 from routes import task_bp, general_bp
 
+# Import models
+from models import task_manager
+
 
 def create_app(config_name=None):
     """Application factory pattern"""
@@ -47,6 +51,52 @@ def create_app(config_name=None):
     return app
 
 
+def run_production_server(app, config_obj):
+    """Run the application under gunicorn with a threaded worker pool"""
+    if sys.platform == 'win32':
+        raise RuntimeError("The production server is not supported on Windows, "
+                           "set FLASK_SERVER=development")
+    
+    try:
+        from gunicorn.app.base import BaseApplication
+    except ImportError:
+        raise RuntimeError("The production server requires gunicorn: pip install gunicorn")
+    
+    # Never serve the debugger or propagate exceptions past the error handlers
+    app.config['DEBUG'] = False
+    
+    class ProductionServer(BaseApplication):
+        """Gunicorn application serving an already created Flask app"""
+        
+        def __init__(self, application, options):
+            self.application = application
+            self.options = options
+            super().__init__()
+        
+        def load_config(self):
+            for key, value in self.options.items():
+                self.cfg.set(key, value)
+        
+        def load(self):
+            return self.application
+    
+    # SIGTERM stops accepting connections and lets workers finish
+    # in-flight requests for up to graceful_timeout seconds
+    options = {
+        'bind': f"{config_obj.HOST}:{config_obj.PORT}",
+        'worker_class': 'gthread',
+        'workers': config_obj.SERVER_WORKERS,
+        'threads': config_obj.SERVER_THREADS,
+        'keepalive': config_obj.SERVER_KEEPALIVE,
+        'backlog': config_obj.SERVER_BACKLOG,
+        'timeout': config_obj.SERVER_TIMEOUT,
+        'graceful_timeout': config_obj.SERVER_GRACEFUL_TIMEOUT,
+        'preload_app': config_obj.SERVER_PRELOAD_APP
+    }
+    
+    ProductionServer(app, options).run()
+
+
 def run_app():
     """Run the Flask application"""
     app = create_app()
@@ -55,6 +105,18 @@ def run_app():
     config_name = os.environ.get('FLASK_ENV', 'default')
     config_obj = config[config_name]
     
+    if config_obj.SERVER not in config_obj.SERVERS:
+        raise ValueError(f"Unknown server '{config_obj.SERVER}', "
+                         f"expected one of: {', '.join(config_obj.SERVERS)}")
+    
+    # Load pre-existing tasks from snapshot
+    if config_obj.SNAPSHOT_PATH and os.path.exists(config_obj.SNAPSHOT_PATH):
+        task_manager.load_snapshot(config_obj.SNAPSHOT_PATH)
+    
+    if config_obj.SERVER == 'production':
+        run_production_server(app, config_obj)
+        return
+    
     # Run the application
     app.run(
         debug=config_obj.DEBUG,
@@ -0,0 +1,137 @@
+"""
+Benchmark script for the Task Management REST API servers
+Starts the API with the Flask development server and with the production
+server in turn, and compares request throughput under concurrent load.
+
+Usage:
+    python benchmark_server.py [--requests N] [--concurrency N]
+"""
+
+import argparse
+import os
+import signal
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+APP_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "app.py")
+HOST = "127.0.0.1"
+SERVERS = {
+    'development': 5001,
+    'production': 5002
+}
+
+
+def start_server(server: str, port: int) -> subprocess.Popen:
+    """Start app.py with the given server mode in its own process group"""
+    env = dict(os.environ, FLASK_SERVER=server, FLASK_HOST=HOST, FLASK_PORT=str(port))
+    return subprocess.Popen(
+        [sys.executable, APP_PATH],
+        cwd=os.path.dirname(APP_PATH),
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True
+    )
+
+
+def stop_server(process: subprocess.Popen):
+    """Stop the server and any reloader or worker processes it spawned"""
+    os.killpg(process.pid, signal.SIGTERM)
+    try:
+        process.wait(timeout=35)
+    except subprocess.TimeoutExpired:
+        os.killpg(process.pid, signal.SIGKILL)
+        process.wait()
+
+
+def wait_for_server(base_url: str, timeout: float = 15.0) -> bool:
+    """Wait until the health check endpoint responds"""
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            if requests.get(f"{base_url}/health", timeout=1).status_code == 200:
+                return True
+        except requests.exceptions.RequestException:
+            pass
+        time.sleep(0.2)
+    return False
+
+
+def run_client(base_url: str, count: int) -> int:
+    """Send a mix of create and read requests over one keep-alive session"""
+    errors = 0
+    with requests.Session() as session:
+        for i in range(count):
+            try:
+                if i % 4 == 0:
+                    response = session.post(f"{base_url}/tasks", json={
+                        "title": f"Benchmark task {i}",
+                        "description": "Created by benchmark_server.py"
+                    })
+                elif i % 4 == 1:
+                    response = session.get(f"{base_url}/tasks/1")
+                else:
+                    response = session.get(f"{base_url}/health")
+            except requests.exceptions.RequestException:
+                errors += 1
+                continue
+            if response.status_code >= 400 and response.status_code != 404:
+                errors += 1
+    return errors
+
+
+def benchmark(server: str, port: int, total_requests: int, concurrency: int):
+    """Benchmark one server mode and return (requests per second, errors)"""
+    base_url = f"http://{HOST}:{port}"
+    process = start_server(server, port)
+    try:
+        if not wait_for_server(base_url):
+            print(f"❌ {server} server did not start on {base_url}")
+            return None
+
+        per_client = total_requests // concurrency
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            errors = sum(executor.map(lambda _: run_client(base_url, per_client), range(concurrency)))
+        elapsed = time.perf_counter() - start
+
+        return per_client * concurrency / elapsed, errors
+    finally:
+        stop_server(process)
+
+
+def main():
+    """Run the benchmark for each server mode"""
+    parser = argparse.ArgumentParser(description="Compare API server throughput")
+    parser.add_argument("--requests", type=int, default=4000, help="total requests per server")
+    parser.add_argument("--concurrency", type=int, default=16, help="number of concurrent clients")
+    args = parser.parse_args()
+    if args.concurrency <= 0:
+        parser.error("--concurrency must be at least 1")
+    if args.concurrency > args.requests:
+        parser.error("--concurrency must not be larger than --requests")
+
+    print("🚀 Benchmarking Task Management API servers")
+    print(f"   {args.requests} requests, {args.concurrency} concurrent clients")
+    print("=" * 50)
+
+    results = {}
+    for server, port in SERVERS.items():
+        result = benchmark(server, port, args.requests, args.concurrency)
+        if result is None:
+            continue
+        results[server] = result[0]
+        print(f"✅ {server:<12} {result[0]:>10.1f} req/s   ({result[1]} errors)")
+
+    if len(results) == len(SERVERS):
+        speedup = results['production'] / results['development']
+        print("=" * 50)
+        print(f"🏁 Production server is {speedup:.2f}x the development server")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,6 +3,7 @@ Configuration settings for the Task Management API
 """
 
 import os
+import sys
 
 
 class Config:
@@ -10,10 +11,24 @@ class Config:
     
     # Flask configuration
     SECRET_KEY = os.environ.get('SECRET_KEY') or 'your-secret-key-here'
-    DEBUG = os.environ.get('FLASK_DEBUG') or True
+    DEBUG = os.environ.get('FLASK_DEBUG', 'true').lower() in ('1', 'true', 'yes')
     HOST = os.environ.get('FLASK_HOST') or '0.0.0.0'
     PORT = int(os.environ.get('FLASK_PORT') or 5000)
     
+    # Server configuration ('development' for the Flask dev server,
+    # 'production' for gunicorn)
+    SERVERS = ('development', 'production')
+    SERVER = os.environ.get('FLASK_SERVER') or 'development'
+    # Tasks are stored in memory per process, so keep a single worker
+    # unless the store is shared
+    SERVER_WORKERS = int(os.environ.get('SERVER_WORKERS') or 1)
+    SERVER_THREADS = int(os.environ.get('SERVER_THREADS') or 8)
+    SERVER_KEEPALIVE = int(os.environ.get('SERVER_KEEPALIVE') or 5)
+    SERVER_BACKLOG = int(os.environ.get('SERVER_BACKLOG') or 2048)
+    SERVER_TIMEOUT = int(os.environ.get('SERVER_TIMEOUT') or 30)
+    SERVER_GRACEFUL_TIMEOUT = int(os.environ.get('SERVER_GRACEFUL_TIMEOUT') or 30)
+    SERVER_PRELOAD_APP = True
+    
     # API configuration
     API_TITLE = "Task Management API"
     API_VERSION = "1.0.0"
@@ -22,6 +37,9 @@ class Config:
     # CORS configuration
     CORS_ORIGINS = os.environ.get('CORS_ORIGINS', '*').split(',')
     
+    # Snapshot configuration
+    SNAPSHOT_PATH = os.environ.get('TASK_SNAPSHOT_PATH')
+    
     # Pagination
     DEFAULT_PAGE_SIZE = 20
     MAX_PAGE_SIZE = 100
@@ -37,6 +55,10 @@ class ProductionConfig(Config):
     """Production configuration"""
     DEBUG = False
     TESTING = False
+    # gunicorn does not run on Windows
+    SERVER = os.environ.get('FLASK_SERVER') or (
+        'development' if sys.platform == 'win32' else 'production'
+    )
 
 
 class TestingConfig(Config):
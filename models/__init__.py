@@ -1,4 +1,5 @@
 # Models package
 from .task import Task, TaskManager, task_manager
+from .snapshot import TaskSnapshot
 
-__all__ = ['Task', 'TaskManager', 'task_manager']
+__all__ = ['Task', 'TaskManager', 'task_manager', 'TaskSnapshot']
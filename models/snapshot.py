@@ -0,0 +1,159 @@
+"""
+Binary snapshot format for the Task Management API
+
+Layout (little-endian):
+    header   magic (8s), version (I), record count (Q), next task id (Q)
+    index    one (task id (q), record offset (Q)) entry per task, sorted by id
+    records  is_completed (?), title length (I), description length (I),
+             followed by the UTF-8 encoded title and description
+"""
+
+from typing import Dict, Iterator, List, Optional
+import bisect
+import mmap
+import os
+import struct
+
+SNAPSHOT_MAGIC = b'TASKSNAP'
+SNAPSHOT_VERSION = 1
+
+_HEADER = struct.Struct('<8sIQQ')
+_INDEX_ENTRY = struct.Struct('<qQ')
+_RECORD_HEADER = struct.Struct('<?II')
+
+
+class _SnapshotIds:
+    """Read-only view over the task ids in the offset table, for bisect"""
+
+    def __init__(self, snapshot: 'TaskSnapshot'):
+        self.snapshot = snapshot
+
+    def __len__(self) -> int:
+        return len(self.snapshot)
+
+    def __getitem__(self, index: int) -> int:
+        return self.snapshot.task_id_at(index)
+
+
+class TaskSnapshot:
+    """Memory-mapped task snapshot with lazily materialized records"""
+
+    def __init__(self, path: str):
+        with open(path, 'rb') as snapshot_file:
+            self._mmap = mmap.mmap(snapshot_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(self._mmap) < _HEADER.size:
+            self._mmap.close()
+            raise ValueError(f"Snapshot file is truncated: {path}")
+
+        magic, version, count, next_id = _HEADER.unpack_from(self._mmap, 0)
+        if magic != SNAPSHOT_MAGIC:
+            self._mmap.close()
+            raise ValueError(f"Not a task snapshot file: {path}")
+        if version != SNAPSHOT_VERSION:
+            self._mmap.close()
+            raise ValueError(f"Unsupported snapshot version: {version}")
+        if len(self._mmap) < _HEADER.size + count * _INDEX_ENTRY.size:
+            self._mmap.close()
+            raise ValueError(f"Snapshot file is truncated: {path}")
+
+        self.count = count
+        self.next_id = next_id
+        self._materialized: Dict[int, Dict] = {}
+
+    @staticmethod
+    def write(path: str, tasks: List[Dict], next_id: int) -> None:
+        """Write tasks to a snapshot file, replacing it atomically"""
+        tasks = sorted(tasks, key=lambda task: task['id'])
+        encoded = [
+            (task['id'], task['is_completed'],
+             task['title'].encode('utf-8'), task['description'].encode('utf-8'))
+            for task in tasks
+        ]
+
+        index = bytearray()
+        records = bytearray()
+        records_start = _HEADER.size + len(encoded) * _INDEX_ENTRY.size
+        for task_id, is_completed, title, description in encoded:
+            index += _INDEX_ENTRY.pack(task_id, records_start + len(records))
+            records += _RECORD_HEADER.pack(is_completed, len(title), len(description))
+            records += title
+            records += description
+
+        temp_path = f"{path}.tmp"
+        try:
+            with open(temp_path, 'wb') as snapshot_file:
+                snapshot_file.write(_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, len(encoded), next_id))
+                snapshot_file.write(index)
+                snapshot_file.write(records)
+                snapshot_file.flush()
+                os.fsync(snapshot_file.fileno())
+            os.replace(temp_path, path)
+        except Exception:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+    def __len__(self) -> int:
+        return self.count
+
+    def task_id_at(self, index: int) -> int:
+        """Get the task id stored at an index without materializing the record"""
+        task_id, _ = _INDEX_ENTRY.unpack_from(self._mmap, _HEADER.size + index * _INDEX_ENTRY.size)
+        return task_id
+
+    def find(self, task_id: int) -> Optional[int]:
+        """Get the index of a task id, or None if it is not in the snapshot"""
+        index = bisect.bisect_left(_SnapshotIds(self), task_id)
+        if index < self.count and self.task_id_at(index) == task_id:
+            return index
+        return None
+
+    def get(self, index: int) -> Dict:
+        """Get the task at an index, materializing it on first access
+
+        The returned dict is kept so that updates to it are seen by later
+        reads of the same task.
+        """
+        task = self._materialized.get(index)
+        if task is not None:
+            return task
+        # setdefault keeps a single dict per record if two readers race
+        return self._materialized.setdefault(index, self._decode(index))
+
+    def read(self, index: int) -> Dict:
+        """Get the task at an index without keeping a decoded copy of it"""
+        task = self._materialized.get(index)
+        if task is not None:
+            return task
+        return self._decode(index)
+
+    def discard(self, index: int):
+        """Drop the decoded copy of a task, if one is kept"""
+        self._materialized.pop(index, None)
+
+    def _decode(self, index: int) -> Dict:
+        """Decode the record at an index into a new task dict"""
+        task_id, offset = _INDEX_ENTRY.unpack_from(self._mmap, _HEADER.size + index * _INDEX_ENTRY.size)
+        if offset + _RECORD_HEADER.size > len(self._mmap):
+            raise ValueError(f"Snapshot record {index} is out of bounds")
+        is_completed, title_length, description_length = _RECORD_HEADER.unpack_from(self._mmap, offset)
+        title_start = offset + _RECORD_HEADER.size
+        description_start = title_start + title_length
+        description_end = description_start + description_length
+        if description_end > len(self._mmap):
+            raise ValueError(f"Snapshot record {index} is out of bounds")
+        return {
+            'id': task_id,
+            'title': self._mmap[title_start:description_start].decode('utf-8'),
+            'description': self._mmap[description_start:description_end].decode('utf-8'),
+            'is_completed': is_completed
+        }
+
+    def __iter__(self) -> Iterator[Dict]:
+        for index in range(self.count):
+            yield self.read(index)
+
+    def close(self):
+        """Release the memory mapping"""
+        self._mmap.close()
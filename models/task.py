@@ -2,9 +2,11 @@
 Task model for the Task Management API
 """
 
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set, Tuple
 import threading
 
+from models.snapshot import TaskSnapshot
+
 
 class Task:
     """Task model class"""
@@ -41,6 +43,8 @@ class TaskManager:
         self.tasks: List[Dict] = []
         self.task_id_counter = 1
         self.lock = threading.Lock()
+        self.snapshot: Optional[TaskSnapshot] = None
+        self.snapshot_deleted: Set[int] = set()
     
     def create_task(self, title: str, description: str, is_completed: bool = False) -> Dict:
         """Create a new task"""
@@ -56,21 +60,21 @@ class TaskManager:
     
     def get_all_tasks(self, is_completed: Optional[bool] = None) -> List[Dict]:
         """Get all tasks with optional filtering"""
+        snapshot, deleted, tasks = self._get_state()
+        tasks = self._get_snapshot_tasks(snapshot, deleted) + tasks
         if is_completed is not None:
-            return [task for task in self.tasks if task['is_completed'] == is_completed]
-        return self.tasks.copy()
+            return [task for task in tasks if task['is_completed'] == is_completed]
+        return tasks
     
     def get_task_by_id(self, task_id: int) -> Optional[Dict]:
         """Get a task by ID"""
-        for task in self.tasks:
-            if task['id'] == task_id:
-                return task
-        return None
+        return self._find_task(task_id, materialize=False)
     
     def update_task(self, task_id: int, title: str = None, description: str = None, 
                    is_completed: bool = None) -> Optional[Dict]:
         """Update a task by ID"""
-        task = self.get_task_by_id(task_id)
+        # Snapshot tasks are materialized so the update is kept
+        task = self._find_task(task_id, materialize=True)
         if task is None:
             return None
         
@@ -91,13 +95,76 @@ class TaskManager:
             return False
         
         with self.lock:
-            self.tasks.remove(task)
+            index = self.snapshot.find(task_id) if self.snapshot is not None else None
+            if index is not None:
+                self.snapshot_deleted.add(index)
+                self.snapshot.discard(index)
+            else:
+                self.tasks.remove(task)
         
         return True
     
     def get_tasks_count(self) -> int:
         """Get total number of tasks"""
-        return len(self.tasks)
+        snapshot, deleted, tasks = self._get_state()
+        snapshot_count = len(snapshot) - len(deleted) if snapshot is not None else 0
+        return snapshot_count + len(tasks)
+    
+    def save_snapshot(self, path: str) -> None:
+        """Save all tasks to a binary snapshot file"""
+        with self.lock:
+            snapshot = self.snapshot
+            deleted = set(self.snapshot_deleted)
+            tasks = self.tasks.copy()
+            next_id = self.task_id_counter
+        
+        # Decode and write outside the lock so writers are not blocked
+        tasks = self._get_snapshot_tasks(snapshot, deleted) + tasks
+        TaskSnapshot.write(path, tasks, next_id)
+    
+    def load_snapshot(self, path: str) -> int:
+        """Replace all tasks with the contents of a snapshot file
+        
+        The file is memory-mapped and tasks are only decoded when first
+        accessed, so loading does not depend on the number of tasks. A
+        replaced snapshot is unmapped once no reader refers to it.
+        """
+        snapshot = TaskSnapshot(path)
+        
+        with self.lock:
+            self.snapshot = snapshot
+            self.snapshot_deleted = set()
+            self.tasks = []
+            self.task_id_counter = snapshot.next_id
+        
+        return len(snapshot)
+    
+    def _get_state(self) -> Tuple[Optional[TaskSnapshot], Set[int], List[Dict]]:
+        """Get a consistent view of the snapshot, deleted indices and new tasks"""
+        with self.lock:
+            return self.snapshot, self.snapshot_deleted, self.tasks
+    
+    def _find_task(self, task_id: int, materialize: bool) -> Optional[Dict]:
+        """Find a task by ID, keeping a decoded snapshot task only if asked"""
+        snapshot, deleted, tasks = self._get_state()
+        if snapshot is not None:
+            index = snapshot.find(task_id)
+            if index is not None:
+                if index in deleted:
+                    return None
+                return snapshot.get(index) if materialize else snapshot.read(index)
+        
+        for task in tasks:
+            if task['id'] == task_id:
+                return task
+        return None
+    
+    @staticmethod
+    def _get_snapshot_tasks(snapshot: Optional[TaskSnapshot], deleted: Set[int]) -> List[Dict]:
+        """Get the tasks from a snapshot that have not been deleted"""
+        if snapshot is None:
+            return []
+        return [snapshot.read(index) for index in range(len(snapshot)) if index not in deleted]
 
 
 # Global task manager instance
@@ -0,0 +1,149 @@
+"""
+Tests for starting the Task Management API
+Run with: python -m pytest test_app.py
+
+The servers are replaced with stubs, so no server is started.
+"""
+
+import importlib
+import sys
+
+import pytest
+from flask import Flask
+
+import app as app_module
+from config import config
+from models import TaskManager
+
+# config.config is shadowed by the config dict re-exported from the package
+config_module = importlib.import_module('config.config')
+
+
+def test_run_app_loads_snapshot(tmp_path, monkeypatch):
+    """Test that run_app loads tasks from SNAPSHOT_PATH before serving"""
+    path = str(tmp_path / "tasks.snap")
+    saved = TaskManager()
+    saved.create_task("Saved", "Loaded on startup")
+    saved.save_snapshot(path)
+
+    manager = TaskManager()
+    served = []
+    monkeypatch.setattr(app_module, 'task_manager', manager)
+    monkeypatch.setattr(Flask, 'run', lambda self, **kwargs: served.append(manager.get_tasks_count()))
+    monkeypatch.setenv('FLASK_ENV', 'development')
+    monkeypatch.setattr(config['development'], 'SERVER', 'development')
+    monkeypatch.setattr(config['development'], 'SNAPSHOT_PATH', path)
+
+    app_module.run_app()
+    assert served == [1]
+    assert manager.get_task_by_id(1)['title'] == "Saved"
+
+
+def test_create_app_keeps_tasks(tmp_path, monkeypatch):
+    """Test that creating another app does not replace in-memory tasks"""
+    path = str(tmp_path / "tasks.snap")
+    TaskManager().save_snapshot(path)
+
+    manager = TaskManager()
+    manager.create_task("Existing", "Created before create_app")
+    monkeypatch.setattr(app_module, 'task_manager', manager)
+    monkeypatch.setattr(config['testing'], 'SNAPSHOT_PATH', path)
+
+    app_module.create_app('testing')
+    assert manager.get_tasks_count() == 1
+
+
+def test_unknown_server_rejected(monkeypatch):
+    """Test that an unknown FLASK_SERVER value raises ValueError"""
+    served = []
+    monkeypatch.setattr(Flask, 'run', lambda self, **kwargs: served.append('development'))
+    monkeypatch.setenv('FLASK_ENV', 'development')
+    monkeypatch.setattr(config['development'], 'SERVER', 'gunicorn')
+
+    with pytest.raises(ValueError, match="Unknown server 'gunicorn'"):
+        app_module.run_app()
+    assert served == []
+
+
+@pytest.mark.parametrize('server', ['development', 'production'])
+def test_server_selection(monkeypatch, server):
+    """Test that SERVER picks the development or production server"""
+    served = []
+    monkeypatch.setattr(Flask, 'run', lambda self, **kwargs: served.append('development'))
+    monkeypatch.setattr(app_module, 'run_production_server',
+                        lambda app, config_obj: served.append('production'))
+    monkeypatch.setenv('FLASK_ENV', 'development')
+    monkeypatch.setattr(config['development'], 'SERVER', server)
+    monkeypatch.setattr(config['development'], 'SNAPSHOT_PATH', None)
+
+    app_module.run_app()
+    assert served == [server]
+
+
+def test_production_server_disables_debug(monkeypatch):
+    """Test that the production server never serves a debug app"""
+    base = pytest.importorskip('gunicorn.app.base')
+    served = []
+    monkeypatch.setattr(base.BaseApplication, 'run', lambda self: served.append(self.load()))
+
+    app = app_module.create_app('development')
+    assert app.config['DEBUG'] is True
+    app_module.run_production_server(app, config['development'])
+    assert served == [app]
+    assert app.config['DEBUG'] is False
+
+
+def test_production_server_rejected_on_windows(monkeypatch):
+    """Test that the production server explains how to run on Windows"""
+    monkeypatch.setattr(sys, 'platform', 'win32')
+
+    with pytest.raises(RuntimeError, match="FLASK_SERVER=development"):
+        app_module.run_production_server(app_module.create_app('testing'), config['testing'])
+
+
+@pytest.fixture
+def reload_config(monkeypatch):
+    """Reload config/config.py with the current environment and platform"""
+    yield lambda: importlib.reload(config_module)
+    monkeypatch.undo()
+    importlib.reload(config_module)
+
+
+@pytest.mark.parametrize('value, expected', [
+    (None, True),
+    ('1', True),
+    ('true', True),
+    ('True', True),
+    ('0', False),
+    ('false', False),
+    ('', False),
+])
+def test_flask_debug_parsing(monkeypatch, reload_config, value, expected):
+    """Test that FLASK_DEBUG is parsed as a boolean"""
+    if value is None:
+        monkeypatch.delenv('FLASK_DEBUG', raising=False)
+    else:
+        monkeypatch.setenv('FLASK_DEBUG', value)
+
+    assert reload_config().Config.DEBUG is expected
+
+
+@pytest.mark.parametrize('platform, expected', [
+    ('linux', 'production'),
+    ('win32', 'development'),
+])
+def test_production_config_default_server(monkeypatch, reload_config, platform, expected):
+    """Test the default server of each configuration"""
+    monkeypatch.delenv('FLASK_SERVER', raising=False)
+    monkeypatch.setattr(sys, 'platform', platform)
+
+    module = reload_config()
+    assert module.ProductionConfig.SERVER == expected
+    assert module.DevelopmentConfig.SERVER == 'development'
+
+
+def test_flask_server_overrides_default(monkeypatch, reload_config):
+    """Test that FLASK_SERVER overrides the configuration default"""
+    monkeypatch.setenv('FLASK_SERVER', 'development')
+
+    assert reload_config().ProductionConfig.SERVER == 'development'
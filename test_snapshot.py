@@ -0,0 +1,201 @@
+"""
+Tests for task snapshots
+Run with: python -m pytest test_snapshot.py
+
+These tests exercise TaskManager and TaskSnapshot directly and do not need
+a running server.
+"""
+
+import os
+import struct
+import threading
+
+import pytest
+
+from models import TaskManager
+from models.snapshot import SNAPSHOT_MAGIC, SNAPSHOT_VERSION
+
+
+def create_manager(count: int = 5) -> TaskManager:
+    """Create a task manager with some tasks"""
+    manager = TaskManager()
+    for i in range(count):
+        manager.create_task(f"Task {i}", f"Description {i} ✓", is_completed=i % 2 == 0)
+    return manager
+
+
+def test_round_trip(tmp_path):
+    """Test that a loaded snapshot returns the saved tasks"""
+    path = str(tmp_path / "tasks.snap")
+    manager = create_manager()
+    manager.save_snapshot(path)
+
+    loaded = TaskManager()
+    assert loaded.load_snapshot(path) == 5
+    assert loaded.get_all_tasks() == manager.get_all_tasks()
+    assert loaded.get_all_tasks(True) == manager.get_all_tasks(True)
+    assert loaded.get_task_by_id(3) == manager.get_task_by_id(3)
+    assert loaded.get_tasks_count() == 5
+
+
+def test_task_id_counter_restored(tmp_path):
+    """Test that new tasks continue after the ids in the snapshot"""
+    path = str(tmp_path / "tasks.snap")
+    manager = create_manager()
+    manager.delete_task(5)
+    manager.save_snapshot(path)
+
+    loaded = TaskManager()
+    loaded.load_snapshot(path)
+    assert loaded.task_id_counter == 6
+    assert loaded.create_task("New", "Created after load")['id'] == 6
+
+
+def test_update_and_delete_snapshot_tasks(tmp_path):
+    """Test updating and deleting tasks loaded from a snapshot"""
+    path = str(tmp_path / "tasks.snap")
+    create_manager().save_snapshot(path)
+
+    loaded = TaskManager()
+    loaded.load_snapshot(path)
+
+    updated = loaded.update_task(2, title="Updated", is_completed=True)
+    assert updated['title'] == "Updated"
+    assert loaded.get_task_by_id(2)['title'] == "Updated"
+    assert loaded.get_all_tasks()[1]['is_completed'] is True
+
+    assert loaded.delete_task(4) is True
+    assert loaded.delete_task(4) is False
+    assert loaded.get_task_by_id(4) is None
+    assert loaded.get_tasks_count() == 4
+    assert [task['id'] for task in loaded.get_all_tasks()] == [1, 2, 3, 5]
+
+    loaded.create_task("New", "Created after load")
+    assert loaded.get_tasks_count() == 5
+
+    loaded.save_snapshot(path)
+    reloaded = TaskManager()
+    reloaded.load_snapshot(path)
+    assert reloaded.get_all_tasks() == loaded.get_all_tasks()
+
+
+def test_empty_snapshot(tmp_path):
+    """Test saving and loading a snapshot with no tasks"""
+    path = str(tmp_path / "tasks.snap")
+    TaskManager().save_snapshot(path)
+
+    loaded = TaskManager()
+    assert loaded.load_snapshot(path) == 0
+    assert loaded.get_all_tasks() == []
+    assert loaded.get_task_by_id(1) is None
+    assert loaded.get_tasks_count() == 0
+    assert loaded.create_task("First", "Created after load")['id'] == 1
+
+
+def test_reload_replaces_tasks(tmp_path):
+    """Test that loading a second snapshot replaces the first"""
+    first_path = str(tmp_path / "first.snap")
+    second_path = str(tmp_path / "second.snap")
+    create_manager(5).save_snapshot(first_path)
+    create_manager(2).save_snapshot(second_path)
+
+    loaded = TaskManager()
+    loaded.load_snapshot(first_path)
+    loaded.load_snapshot(second_path)
+    assert loaded.get_tasks_count() == 2
+    assert loaded.get_task_by_id(3) is None
+
+
+@pytest.mark.parametrize('header, message', [
+    (struct.pack('<8sIQQ', b'NOTASNAP', SNAPSHOT_VERSION, 0, 1), "Not a task snapshot"),
+    (struct.pack('<8sIQQ', SNAPSHOT_MAGIC, SNAPSHOT_VERSION + 1, 0, 1), "Unsupported snapshot version"),
+    (struct.pack('<8sIQQ', SNAPSHOT_MAGIC, SNAPSHOT_VERSION, 10, 11), "truncated"),
+    (SNAPSHOT_MAGIC, "truncated"),
+])
+def test_invalid_snapshot_rejected(tmp_path, header, message):
+    """Test that invalid snapshot files raise ValueError"""
+    path = tmp_path / "tasks.snap"
+    path.write_bytes(header)
+
+    with pytest.raises(ValueError, match=message):
+        TaskManager().load_snapshot(str(path))
+
+
+def test_truncated_records_rejected(tmp_path):
+    """Test that a file cut off inside a record raises ValueError"""
+    path = tmp_path / "tasks.snap"
+    create_manager().save_snapshot(str(path))
+    path.write_bytes(path.read_bytes()[:-3])
+
+    loaded = TaskManager()
+    loaded.load_snapshot(str(path))
+    assert loaded.get_task_by_id(1)['title'] == "Task 0"
+    with pytest.raises(ValueError, match="out of bounds"):
+        loaded.get_task_by_id(5)
+
+
+def test_read_only_access_does_not_materialize(tmp_path):
+    """Test that lookups and listings do not keep decoded tasks"""
+    path = str(tmp_path / "tasks.snap")
+    create_manager().save_snapshot(path)
+
+    loaded = TaskManager()
+    loaded.load_snapshot(path)
+    for task_id in range(1, 6):
+        assert loaded.get_task_by_id(task_id)['id'] == task_id
+    loaded.get_all_tasks()
+    loaded.get_all_tasks(True)
+    assert loaded.snapshot._materialized == {}
+
+    loaded.update_task(2, title="Updated")
+    assert list(loaded.snapshot._materialized) == [1]
+
+
+def test_delete_releases_materialized_task(tmp_path):
+    """Test that deleting an updated snapshot task drops its decoded copy"""
+    path = str(tmp_path / "tasks.snap")
+    create_manager().save_snapshot(path)
+
+    loaded = TaskManager()
+    loaded.load_snapshot(path)
+    loaded.update_task(3, title="Updated")
+    assert loaded.delete_task(3) is True
+    assert loaded.snapshot._materialized == {}
+
+
+def test_reload_while_reading(tmp_path):
+    """Test that readers keep working while the snapshot is reloaded"""
+    path = str(tmp_path / "tasks.snap")
+    create_manager(200).save_snapshot(path)
+
+    loaded = TaskManager()
+    loaded.load_snapshot(path)
+    errors = []
+
+    def read_tasks():
+        try:
+            for _ in range(50):
+                assert len(loaded.get_all_tasks()) == 200
+                assert loaded.get_task_by_id(100)['id'] == 100
+        except Exception as e:
+            errors.append(e)
+
+    reader = threading.Thread(target=read_tasks)
+    reader.start()
+    for _ in range(50):
+        loaded.load_snapshot(path)
+    reader.join()
+    assert errors == []
+
+
+def test_failed_write_removes_temp_file(tmp_path, monkeypatch):
+    """Test that a failed save does not leave a temporary file behind"""
+    path = tmp_path / "tasks.snap"
+
+    def fail_fsync(fd):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(os, 'fsync', fail_fsync)
+    with pytest.raises(OSError):
+        create_manager().save_snapshot(str(path))
+    assert list(tmp_path.iterdir()) == []